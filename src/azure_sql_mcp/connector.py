@@ -1,14 +1,54 @@
 import logging
 import os
+import queue
+import string
+import threading
+import time
 import pyodbc
-from typing import Optional
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Sequence, Tuple
 from dotenv import load_dotenv
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Enable ODBC driver manager pooling; must be set before the first connect
+pyodbc.pooling = True
+
+POOL_SIZE = int(os.getenv("AZURE_SQL_POOL_SIZE", "10"))
+# Seconds acquire() waits for a free connection once POOL_SIZE are in use
+POOL_TIMEOUT = float(os.getenv("AZURE_SQL_POOL_TIMEOUT", "30"))
+# Pooled connections idle longer than this are pinged before reuse; Azure SQL
+# closes idle sessions at the gateway, and the failure would hit a tool call
+POOL_PING_AFTER = float(os.getenv("AZURE_SQL_POOL_PING_AFTER", "60"))
+STATEMENT_CACHE_SIZE = 64
+# Largest TDS packet SQL Server accepts; bigger packets mean fewer reads on large results
+PACKET_SIZE = int(os.getenv("AZURE_SQL_PACKET_SIZE", "32767"))
+SQL_ATTR_PACKET_SIZE = 112
+
 class AzureSQLConnector:
+    # Built once; setup_connection only substitutes the environment values
+    CONNECTION_TEMPLATE = string.Template(
+        "DRIVER={ODBC Driver 17 for SQL Server};"
+        "SERVER=${server};"
+        "DATABASE=${database};"
+        "UID=${username};"
+        "PWD=${password};"
+        "Encrypt=yes;"
+        "TrustServerCertificate=no;"
+        "Connection Timeout=30;"
+    )
+
     def __init__(self):
         self.connection_string: Optional[str] = None
+        # Idle connections with the monotonic time they were last released
+        self._pool: "queue.Queue[Tuple[pyodbc.Connection, float]]" = queue.Queue(maxsize=POOL_SIZE)
+        # Caps open connections, pooled or borrowed. Abandoned worker threads
+        # keep their slot until they finish, so cancelled calls cannot make
+        # acquire() open connections without bound.
+        self._slots = threading.BoundedSemaphore(POOL_SIZE)
+        # Per-connection LRU of cursors keyed by SQL text
+        self._statements: Dict[pyodbc.Connection, "OrderedDict[str, pyodbc.Cursor]"] = {}
         self.setup_connection()
 
     def setup_connection(self):
@@ -21,17 +61,13 @@ class AzureSQLConnector:
         if not all([server_name, database, username, password]):
             raise ValueError("Missing required environment variables for Azure SQL connection")
         
-        logger.info(f"Connecting to server: {server_name}, database: {database}")
+        logger.info("Connecting to server: %s, database: %s", server_name, database)
         
-        self.connection_string = (
-            f"DRIVER={{ODBC Driver 17 for SQL Server}};"
-            f"SERVER={server_name};"
-            f"DATABASE={database};"
-            f"UID={username};"
-            f"PWD={password};"
-            f"Encrypt=yes;"
-            f"TrustServerCertificate=no;"
-            f"Connection Timeout=30;"
+        self.connection_string = self.CONNECTION_TEMPLATE.substitute(
+            server=server_name,
+            database=database,
+            username=username,
+            password=password,
         )
 
     def get_connection(self):
@@ -40,7 +76,121 @@ class AzureSQLConnector:
             raise ValueError("Connection string not configured")
         
         try:
-            return pyodbc.connect(self.connection_string)
+            return pyodbc.connect(
+                self.connection_string,
+                autocommit=False,
+                attrs_before={SQL_ATTR_PACKET_SIZE: PACKET_SIZE},
+            )
         except Exception as e:
-            logger.error(f"Database connection failed: {e}")
+            logger.error("Database connection failed: %s", e)
+            raise
+
+    @contextmanager
+    def acquire(self, reuse: bool = True) -> Iterator[pyodbc.Connection]:
+        """Borrow a pooled connection, opening a new one if the pool is empty.
+
+        At most POOL_SIZE connections are out at once; further callers wait up
+        to POOL_TIMEOUT seconds for one to be returned. Like pyodbc's own
+        connection context manager, the transaction is committed on a clean
+        exit and rolled back if the block raises. Pass ``reuse=False`` when the
+        block may change session state (USE, SET, #temp tables) so the
+        connection is closed instead of handed to the next caller.
+        """
+        if not self._slots.acquire(timeout=POOL_TIMEOUT):
+            raise TimeoutError("Timed out waiting for a free database connection")
+        try:
+            conn = self._checkout()
+        except BaseException:
+            self._slots.release()
+            raise
+
+        healthy = reuse
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            try:
+                conn.rollback()
+            except pyodbc.Error:
+                # A failed rollback means the link itself is gone
+                healthy = False
             raise
+        finally:
+            self.release(conn, healthy)
+            self._slots.release()
+
+    def release(self, conn: pyodbc.Connection, healthy: bool = True) -> None:
+        """Return a connection to the pool, closing it if dead or the pool is full"""
+        if healthy and not conn.closed:
+            try:
+                self._pool.put_nowait((conn, time.monotonic()))
+                return
+            except queue.Full:
+                pass
+        self._discard(conn)
+
+    def _checkout(self) -> pyodbc.Connection:
+        """Take a usable idle connection from the pool, or open a new one"""
+        while True:
+            try:
+                conn, released_at = self._pool.get_nowait()
+            except queue.Empty:
+                return self.get_connection()
+            if time.monotonic() - released_at < POOL_PING_AFTER or self._ping(conn):
+                return conn
+            logger.info("Discarding dead pooled connection")
+            self._discard(conn)
+
+    @staticmethod
+    def _ping(conn: pyodbc.Connection) -> bool:
+        """Check an idle connection still reaches the server"""
+        try:
+            cursor = conn.execute("SELECT 1")
+            cursor.fetchall()
+            cursor.close()
+            return True
+        except pyodbc.Error:
+            return False
+
+    def _discard(self, conn: pyodbc.Connection) -> None:
+        self._statements.pop(conn, None)
+        try:
+            conn.close()
+        except pyodbc.Error:
+            pass
+
+    def execute_cached(
+        self, conn: pyodbc.Connection, sql: str, params: Sequence = ()
+    ) -> pyodbc.Cursor:
+        """Execute SQL on a cursor dedicated to that SQL text on this connection.
+
+        pyodbc skips SQLPrepare when a cursor re-executes the statement it last
+        prepared, so repeated identical SQL reuses the server-side handle.
+        Only for the server's own fixed single-statement SQL whose results are
+        read in full; ad-hoc SQL could leave results pending on the connection.
+        """
+        cursor = self._cached_cursor(conn, sql)
+        cursor.execute(sql, params)
+        return cursor
+
+    def executemany_cached(
+        self, conn: pyodbc.Connection, sql: str, rows: Sequence[Sequence]
+    ) -> pyodbc.Cursor:
+        """Execute SQL once per row, sending all parameter rows in a single batch"""
+        cursor = self._cached_cursor(conn, sql)
+        cursor.fast_executemany = True
+        cursor.executemany(sql, rows)
+        return cursor
+
+    def _cached_cursor(self, conn: pyodbc.Connection, sql: str) -> pyodbc.Cursor:
+        statements = self._statements.setdefault(conn, OrderedDict())
+        cursor = statements.get(sql)
+        if cursor is None:
+            cursor = conn.cursor()
+            statements[sql] = cursor
+            if len(statements) > STATEMENT_CACHE_SIZE:
+                _, evicted = statements.popitem(last=False)
+                evicted.close()
+        else:
+            statements.move_to_end(sql)
+        return cursor
@@ -1,115 +1,269 @@
 import asyncio
+import io
 import json
 import logging
+import os
+import re
 import sys
-from typing import Any, Sequence
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import CancelledError
+from typing import Any, Awaitable, Callable, Sequence, TypeVar
+
+import anyio
+import anyio.to_thread
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
 
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
 from mcp.types import Tool, TextContent, LoggingLevel
 
-from .connector import AzureSQLConnector
+from .connector import POOL_SIZE, AzureSQLConnector
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging; stdout carries the MCP stdio transport, so log to stderr
+logging.basicConfig(stream=sys.stderr, level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Create server instance
 server = Server("azure-sql-mcp")
 
-# Create connector instance
-connector = AzureSQLConnector()
+# Connector is created on first use so importing the server does no setup
+# and configuration errors surface as tool errors instead of an import crash
+connector: AzureSQLConnector | None = None
+_connector_lock = threading.Lock()
+
+def _get_connector() -> AzureSQLConnector:
+    global connector
+    if connector is None:
+        with _connector_lock:
+            if connector is None:
+                connector = AzureSQLConnector()
+    return connector
+
+# pyodbc calls block, so tool handlers run them in worker threads instead of
+# on the event loop. Defaults to the pool size so workers never wait for a
+# connection. The limiter is created on first use, inside the event loop.
+_DB_WORKERS = int(os.getenv("AZURE_SQL_WORKERS", str(POOL_SIZE)))
+_db_limiter: anyio.CapacityLimiter | None = None
+
+T = TypeVar("T")
+
+def _get_db_limiter() -> anyio.CapacityLimiter:
+    global _db_limiter
+    if _db_limiter is None:
+        _db_limiter = anyio.CapacityLimiter(_DB_WORKERS)
+    return _db_limiter
+
+async def _run_db(
+    func: Callable[..., T], *args: Any, cancelled: threading.Event | None = None
+) -> T:
+    """Run a blocking database function in a bounded worker thread.
+
+    If the caller is cancelled the thread is abandoned rather than awaited,
+    and ``cancelled`` is set so the function can stop early and release its
+    connection.
+    """
+    try:
+        return await anyio.to_thread.run_sync(
+            func, *args, limiter=_get_db_limiter(), abandon_on_cancel=True
+        )
+    except anyio.get_cancelled_exc_class():
+        if cancelled is not None:
+            cancelled.set()
+        raise
+
+class _ResponseCache:
+    """Bounded LRU of response text with a TTL and a generation counter.
+
+    invalidate() empties the cache and bumps the generation. Callers read
+    ``generation`` before running a query and hand it to put(), which drops
+    the result if an invalidation happened in between, so a read that raced
+    a write cannot store stale data.
+    """
+
+    def __init__(self, ttl: float, maxsize: int, max_bytes: int | None = None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.generation = 0
+        self._entries: "OrderedDict[tuple, tuple[float, str]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: tuple, generation: int, text: str) -> None:
+        if generation != self.generation or self.ttl <= 0:
+            return
+        # getsizeof counts actual bytes held; len() undercounts non-ASCII text
+        if self.max_bytes is not None and sys.getsizeof(text) > self.max_bytes:
+            return
+        self._entries[key] = (time.monotonic(), text)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+# Schemas change rarely, so get_tables/get_table_schema responses are kept
+# for a short while and dropped whenever execute_query runs anything that is
+# not a read-only SELECT, since DDL can hide behind IF, EXEC or SELECT INTO.
+_schema_cache = _ResponseCache(
+    ttl=float(os.getenv("AZURE_SQL_SCHEMA_TTL", "60")), maxsize=256
+)
+# Leading whitespace and /* */ or -- comments before a statement's first keyword
+_LEADING_COMMENTS = r"\s*(?:/\*.*?\*/\s*|--[^\n]*(?:\n\s*|$))*"
+
+def _invalidate_schema_cache() -> None:
+    _schema_cache.invalidate()
+
+# Agents often repeat the same SELECT verbatim, so results of single,
+# side-effect-free SELECTs are kept for a few seconds. Anything else that runs
+# through execute_query invalidates the cache, including reads still in
+# flight. Entries hold the finished response text, so a hit only wraps it in
+# a TextContent.
+MAX_CACHE_BYTES = 1024 * 1024
+_query_cache = _ResponseCache(
+    ttl=float(os.getenv("AZURE_SQL_QUERY_TTL", "5")),
+    maxsize=256,
+    max_bytes=MAX_CACHE_BYTES,
+)
+_READ_ONLY_RE = re.compile(_LEADING_COMMENTS + r"SELECT\b", re.IGNORECASE | re.DOTALL)
+# T-SQL needs no ";" between statements, and a SELECT can still have side
+# effects, so anything resembling a write or a session change keeps a query
+# out of the cache
+_WRITE_KEYWORD_RE = re.compile(
+    r"\b(?:INSERT|UPDATE|DELETE|MERGE|EXEC|EXECUTE|CREATE|ALTER|DROP|TRUNCATE|INTO"
+    r"|GRANT|REVOKE|DENY|DECLARE|SET|USE|WAITFOR|NEXT\s+VALUE\s+FOR)\b",
+    re.IGNORECASE,
+)
+
+def _is_read_only(query: str) -> bool:
+    """Whether query is a single SELECT statement that cannot write"""
+    if not _READ_ONLY_RE.match(query):
+        return False
+    # Any ";" other than a trailing one means a multi-statement batch
+    if ";" in query.rstrip().rstrip(";"):
+        return False
+    return _WRITE_KEYWORD_RE.search(query) is None
+
+def _invalidate_query_cache() -> None:
+    _query_cache.invalidate()
+
+# Tool definitions are static, so they are built once at import
+_TOOLS: list[Tool] = [
+    Tool(
+        name="execute_query",
+        description="Execute a SQL query on Azure SQL Database",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "SQL query to execute"
+                },
+                "parameters": {
+                    "type": "array",
+                    "description": "Query parameters",
+                    "items": {"type": "string"},
+                    "default": []
+                }
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="get_tables",
+        description="Get list of tables in the database",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="get_table_schema",
+        description="Get schema information for a specific table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_name": {
+                    "type": "string",
+                    "description": "Name of the table"
+                }
+            },
+            "required": ["table_name"]
+        }
+    ),
+    # Tool(
+    #     name="create_table",
+    #     description="Create a new table in the database",
+    #     inputSchema={
+    #         "type": "object",
+    #         "properties": {
+    #             "table_name": {
+    #                 "type": "string",
+    #                 "description": "Name of the table to create"
+    #             },
+    #             "columns": {
+    #                 "type": "string",
+    #                 "description": "Column definitions (e.g., 'id INT PRIMARY KEY, name VARCHAR(100)')"
+    #             }
+    #         },
+    #         "required": ["table_name", "columns"]
+    #     }
+    # ),
+    Tool(
+        name="insert_data",
+        description="Insert data into a table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_name": {
+                    "type": "string",
+                    "description": "Name of the table"
+                },
+                "columns": {
+                    "type": "array",
+                    "description": "Column names",
+                    "items": {"type": "string"}
+                },
+                "values": {
+                    "type": "array",
+                    "description": "Values to insert (single row)",
+                    "items": {"type": "string"}
+                },
+                "rows": {
+                    "type": "array",
+                    "description": "Rows to insert in one batch; used instead of values",
+                    "items": {"type": "array", "items": {"type": "string"}}
+                }
+            },
+            "required": ["table_name", "columns"]
+        }
+    )
+]
 
 @server.list_tools()
 async def handle_list_tools() -> list[Tool]:
     """List available tools"""
-    return [
-        Tool(
-            name="execute_query",
-            description="Execute a SQL query on Azure SQL Database",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "SQL query to execute"
-                    },
-                    "parameters": {
-                        "type": "array",
-                        "description": "Query parameters",
-                        "items": {"type": "string"},
-                        "default": []
-                    }
-                },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="get_tables",
-            description="Get list of tables in the database",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="get_table_schema",
-            description="Get schema information for a specific table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "Name of the table"
-                    }
-                },
-                "required": ["table_name"]
-            }
-        ),
-        # Tool(
-        #     name="create_table",
-        #     description="Create a new table in the database",
-        #     inputSchema={
-        #         "type": "object",
-        #         "properties": {
-        #             "table_name": {
-        #                 "type": "string",
-        #                 "description": "Name of the table to create"
-        #             },
-        #             "columns": {
-        #                 "type": "string",
-        #                 "description": "Column definitions (e.g., 'id INT PRIMARY KEY, name VARCHAR(100)')"
-        #             }
-        #         },
-        #         "required": ["table_name", "columns"]
-        #     }
-        # ),
-        # Tool(
-        #     name="insert_data",
-        #     description="Insert data into a table",
-        #     inputSchema={
-        #         "type": "object",
-        #         "properties": {
-        #             "table_name": {
-        #                 "type": "string",
-        #                 "description": "Name of the table"
-        #             },
-        #             "columns": {
-        #                 "type": "array",
-        #                 "description": "Column names",
-        #                 "items": {"type": "string"}
-        #             },
-        #             "values": {
-        #                 "type": "array",
-        #                 "description": "Values to insert",
-        #                 "items": {"type": "string"}
-        #             }
-        #         },
-        #         "required": ["table_name", "columns", "values"]
-        #     }
-        # )
-    ]
+    return _TOOLS
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict | None) -> list[TextContent]:
@@ -118,144 +272,287 @@ async def handle_call_tool(name: str, arguments: dict | None) -> list[TextConten
         arguments = {}
     
     try:
-        if name == "execute_query":
-            return await execute_query(arguments)
-        elif name == "get_tables":
-            return await get_tables()
-        elif name == "get_table_schema":
-            return await get_table_schema(arguments)
-        # elif name == "create_table":
-        #     return await create_table(arguments)
-        # elif name == "insert_data":
-        #     return await insert_data(arguments)
-        else:
+        handler = _HANDLERS.get(name)
+        if handler is None:
             return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        return await handler(arguments)
     except Exception as e:
-        logger.error(f"Tool execution failed: {e}")
+        logger.error("Tool execution failed: %s", e)
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 # [Keep all your existing tool implementation functions here]
+_ARRAYSIZE = int(os.getenv("AZURE_SQL_ARRAYSIZE", "500"))
+
+_LIST_TABLES_SQL = """
+    SELECT TABLE_NAME
+    FROM INFORMATION_SCHEMA.TABLES
+    WHERE TABLE_TYPE = 'BASE TABLE'
+"""
+
+_TABLE_SCHEMA_SQL = """
+    SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, COLUMN_DEFAULT
+    FROM INFORMATION_SCHEMA.COLUMNS
+    WHERE TABLE_NAME = ?
+    ORDER BY ORDINAL_POSITION
+"""
+
+# A bracket-quoted identifier, where "]]" stands for a literal "]"
+_BRACKETED = r"\[(?:[^\]]|\]\])*\]"
+_BRACKETED_RE = re.compile(_BRACKETED)
+# Unbracketed parts may not contain "[", so validation and splitting agree
+_TABLE_PART = rf"{_BRACKETED}|[^.\[]+"
+_TABLE_NAME_RE = re.compile(rf"(?:{_TABLE_PART})(?:\.(?:{_TABLE_PART}))*")
+_TABLE_PART_RE = re.compile(_TABLE_PART)
+
+def _quote_ident(name: str) -> str:
+    """Quote a SQL Server identifier, escaping embedded closing brackets.
+
+    Names that are already bracket-quoted are returned unchanged.
+    """
+    if _BRACKETED_RE.fullmatch(name):
+        return name
+    return "[" + name.replace("]", "]]") + "]"
+
+def _quote_table(table_name: str) -> str:
+    """Quote each part of a possibly schema-qualified table name.
+
+    Parts may already be bracket-quoted, and dots inside brackets do not
+    split the name, so "dbo.Users", "[dbo].[Users]" and "[my.table]" all work.
+    """
+    if not _TABLE_NAME_RE.fullmatch(table_name):
+        raise ValueError(f"Invalid table name: {table_name!r}")
+    return ".".join(_quote_ident(part) for part in _TABLE_PART_RE.findall(table_name))
+
+# Insert statements keyed by (table, columns); reusing the exact same SQL text
+# also lets execute_cached reuse the prepared cursor for that shape.
+_INSERT_TEMPLATE_CACHE_SIZE = 256
+_insert_template_cache: dict[tuple[str, tuple[str, ...]], str] = {}
+
+def _insert_sql(table_name: str, columns: Sequence[str]) -> str:
+    key = (table_name, tuple(columns))
+    sql = _insert_template_cache.get(key)
+    if sql is None:
+        if len(_insert_template_cache) >= _INSERT_TEMPLATE_CACHE_SIZE:
+            _insert_template_cache.clear()
+        sql = (
+            f"INSERT INTO {_quote_table(table_name)} "
+            f"({', '.join(map(_quote_ident, columns))}) "
+            f"VALUES ({', '.join(['?'] * len(columns))})"
+        )
+        _insert_template_cache[key] = sql
+    return sql
+
+# Datetimes go through default=str like json.dumps, not orjson's ISO "T" form
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME if orjson is not None else 0
+)
+
+def _dumps_rows(rows: list[dict]) -> str:
+    if orjson is not None:
+        return orjson.dumps(rows, default=str, option=_ORJSON_OPTIONS).decode()
+    return json.dumps(rows, indent=2, default=str)
+
+def _fetch_json(
+    cursor: Any, cancelled: threading.Event | None = None, prefix: str = ""
+) -> str:
+    """Fetch the current result set as a JSON array laid out like json.dumps(indent=2).
+
+    Rows are pulled arraysize at a time, each batch is serialized with a single
+    dumps call, and the batches are spliced into one buffer that starts with
+    ``prefix``, so only one batch of rows is held at a time and the full
+    response text is built exactly once. Raises CancelledError between
+    batches once ``cancelled`` is set.
+    """
+    columns = [desc[0] for desc in cursor.description]
+    buf = io.StringIO()
+    buf.write(prefix)
+    separator = "[\n"
+    while True:
+        if cancelled is not None and cancelled.is_set():
+            cursor.cancel()
+            raise CancelledError("Query cancelled")
+        rows = cursor.fetchmany(cursor.arraysize)
+        if not rows:
+            break
+        batch = _dumps_rows([dict(zip(columns, row)) for row in rows])
+        buf.write(separator)
+        separator = ",\n"
+        # Drop the batch's own "[\n" and "\n]" so batches join into one array
+        buf.write(batch[2:-2])
+    buf.write("[]" if separator == "[\n" else "\n]")
+    return buf.getvalue()
+
+def _execute_query_sync(
+    query: str, parameters: list, cancelled: threading.Event | None = None
+) -> tuple[str, bool]:
+    # Anything but a read-only SELECT may leave session state behind (USE,
+    # SET, #temp tables), so its connection is closed rather than pooled
+    with _get_connector().acquire(reuse=_is_read_only(query)) as conn:
+        # Ad-hoc SQL gets its own cursor rather than a cached one, and any
+        # further result sets (e.g. the SELECT in "UPDATE ...; SELECT ...")
+        # are drained before it is closed so the pooled connection is not
+        # left busy and every statement in the batch runs to completion.
+        cursor = conn.cursor()
+        try:
+            cursor.arraysize = _ARRAYSIZE
+            cursor.execute(query, parameters)
+
+            # pyodbc sets description only when the statement produced a result
+            # set, which also covers WITH, EXEC and OUTPUT clauses. Either way
+            # acquire() commits on exit, so writes that return rows are kept.
+            if cursor.description is None:
+                text, returned_rows = "Query executed successfully.", False
+            else:
+                prefix = "Query executed successfully.\nResults:\n"
+                text, returned_rows = _fetch_json(cursor, cancelled, prefix=prefix), True
+            while cursor.nextset():
+                pass
+            return text, returned_rows
+        finally:
+            cursor.close()
+
 async def execute_query(arguments: dict) -> list[TextContent]:
     """Execute SQL query"""
     query = arguments.get("query", "")
     parameters = arguments.get("parameters", [])
     
+    read_only = _is_read_only(query)
+    key = (query, repr(parameters))
+    if read_only:
+        text = _query_cache.get(key)
+        if text is not None:
+            return [TextContent(type="text", text=text)]
+
+    generation = _query_cache.generation
+    returned_rows = False
+    cancelled = threading.Event()
     try:
-        with connector.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, parameters)
-            
-            if query.strip().upper().startswith("SELECT"):
-                results = cursor.fetchall()
-                columns = [desc[0] for desc in cursor.description]
-                
-                # Format results as JSON
-                data = []
-                for row in results:
-                    data.append(dict(zip(columns, row)))
-                
-                return [TextContent(
-                    type="text",
-                    text=f"Query executed successfully.\nResults:\n{json.dumps(data, indent=2, default=str)}"
-                )]
-            else:
-                conn.commit()
-                return [TextContent(
-                    type="text",
-                    text="Query executed successfully."
-                )]
+        text, returned_rows = await _run_db(
+            _execute_query_sync, query, parameters, cancelled, cancelled=cancelled
+        )
+        if read_only and returned_rows:
+            _query_cache.put(key, generation, text)
+        return [TextContent(type="text", text=text)]
     except Exception as e:
         return [TextContent(type="text", text=f"Query execution failed: {str(e)}")]
+    finally:
+        # Anything but a read-only SELECT that returned rows may have written,
+        # including batches that failed or were cancelled part way through
+        if not (read_only and returned_rows):
+            _invalidate_query_cache()
+            _invalidate_schema_cache()
+
+def _get_tables_sync() -> str:
+    db = _get_connector()
+    with db.acquire() as conn:
+        cursor = db.execute_cached(conn, _LIST_TABLES_SQL)
+        tables = [row[0] for row in cursor.fetchall()]
+
+        return f"Tables in database:\n{json.dumps(tables, indent=2)}"
 
-async def get_tables() -> list[TextContent]:
+async def get_tables(arguments: dict | None = None) -> list[TextContent]:
     """Get list of tables"""
+    text = _schema_cache.get(("tables",))
+    if text is not None:
+        return [TextContent(type="text", text=text)]
+
+    generation = _schema_cache.generation
     try:
-        with connector.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT TABLE_NAME
-                FROM INFORMATION_SCHEMA.TABLES
-                WHERE TABLE_TYPE = 'BASE TABLE'
-            """)
-            tables = [row[0] for row in cursor.fetchall()]
-            
-            return [TextContent(
-                type="text",
-                text=f"Tables in database:\n{json.dumps(tables, indent=2)}"
-            )]
+        text = await _run_db(_get_tables_sync)
+        _schema_cache.put(("tables",), generation, text)
+        return [TextContent(type="text", text=text)]
     except Exception as e:
         return [TextContent(type="text", text=f"Failed to get tables: {str(e)}")]
 
+def _get_table_schema_sync(table_name: str) -> str:
+    db = _get_connector()
+    with db.acquire() as conn:
+        cursor = db.execute_cached(conn, _TABLE_SCHEMA_SQL, [table_name])
+
+        columns = []
+        for row in cursor.fetchall():
+            columns.append({
+                "column_name": row[0],
+                "data_type": row[1],
+                "is_nullable": row[2],
+                "default_value": row[3]
+            })
+
+        return f"Schema for table '{table_name}':\n{json.dumps(columns, indent=2)}"
+
 async def get_table_schema(arguments: dict) -> list[TextContent]:
     """Get table schema"""
     table_name = arguments.get("table_name", "")
     
+    text = _schema_cache.get(("schema", table_name))
+    if text is not None:
+        return [TextContent(type="text", text=text)]
+
+    generation = _schema_cache.generation
     try:
-        with connector.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, COLUMN_DEFAULT
-                FROM INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_NAME = ?
-                ORDER BY ORDINAL_POSITION
-            """, table_name)
-            
-            columns = []
-            for row in cursor.fetchall():
-                columns.append({
-                    "column_name": row[0],
-                    "data_type": row[1],
-                    "is_nullable": row[2],
-                    "default_value": row[3]
-                })
-            
-            return [TextContent(
-                type="text",
-                text=f"Schema for table '{table_name}':\n{json.dumps(columns, indent=2)}"
-            )]
+        text = await _run_db(_get_table_schema_sync, table_name)
+        _schema_cache.put(("schema", table_name), generation, text)
+        return [TextContent(type="text", text=text)]
     except Exception as e:
         return [TextContent(type="text", text=f"Failed to get schema: {str(e)}")]
 
+# def _create_table_sync(table_name: str, columns: str) -> str:
+#     with _get_connector().acquire() as conn:
+#         cursor = conn.cursor()
+#         query = f"CREATE TABLE {_quote_table(table_name)} ({columns})"
+#         cursor.execute(query)
+
+#         return f"Table '{table_name}' created successfully."
+
 # async def create_table(arguments: dict) -> list[TextContent]:
 #     """Create table"""
 #     table_name = arguments.get("table_name", "")
 #     columns = arguments.get("columns", "")
     
 #     try:
-#         with connector.get_connection() as conn:
-#             cursor = conn.cursor()
-#             query = f"CREATE TABLE {table_name} ({columns})"
-#             cursor.execute(query)
-#             conn.commit()
-            
-#             return [TextContent(
-#                 type="text",
-#                 text=f"Table '{table_name}' created successfully."
-#             )]
+#         text = await _run_db(_create_table_sync, table_name, columns)
+#         _invalidate_schema_cache()
+#         _invalidate_query_cache()
+#         return [TextContent(type="text", text=text)]
 #     except Exception as e:
 #         return [TextContent(type="text", text=f"Failed to create table: {str(e)}")]
 
-# async def insert_data(arguments: dict) -> list[TextContent]:
-#     """Insert data into table"""
-#     table_name = arguments.get("table_name", "")
-#     columns = arguments.get("columns", [])
-#     values = arguments.get("values", [])
-    
-#     try:
-#         with connector.get_connection() as conn:
-#             cursor = conn.cursor()
-#             columns_str = ", ".join(columns)
-#             placeholders = ", ".join(["?" for _ in values])
-#             query = f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders})"
-#             cursor.execute(query, values)
-#             conn.commit()
-            
-#             return [TextContent(
-#                 type="text",
-#                 text=f"Data inserted into '{table_name}' successfully."
-#             )]
-#     except Exception as e:
-#         return [TextContent(type="text", text=f"Failed to insert data: {str(e)}")]
+def _insert_data_sync(table_name: str, columns: list, values: list, rows: list) -> str:
+    db = _get_connector()
+    sql = _insert_sql(table_name, columns)
+    with db.acquire() as conn:
+        if rows:
+            db.executemany_cached(conn, sql, rows)
+            return f"{len(rows)} rows inserted into '{table_name}' successfully."
+        db.execute_cached(conn, sql, values)
+        return f"Data inserted into '{table_name}' successfully."
+
+async def insert_data(arguments: dict) -> list[TextContent]:
+    """Insert data into table"""
+    table_name = arguments.get("table_name", "")
+    columns = arguments.get("columns", [])
+    values = arguments.get("values", [])
+    rows = arguments.get("rows", [])
+
+    if not values and not rows:
+        return [TextContent(type="text", text="Failed to insert data: either 'values' or 'rows' is required")]
+
+    try:
+        text = await _run_db(_insert_data_sync, table_name, columns, values, rows)
+        return [TextContent(type="text", text=text)]
+    except Exception as e:
+        return [TextContent(type="text", text=f"Failed to insert data: {str(e)}")]
+    finally:
+        _invalidate_query_cache()
+
+# Tool name -> handler; every handler takes the tool's arguments dict
+_HANDLERS: dict[str, Callable[[dict], Awaitable[list[TextContent]]]] = {
+    "execute_query": execute_query,
+    "get_tables": get_tables,
+    "get_table_schema": get_table_schema,
+    # "create_table": create_table,
+    "insert_data": insert_data,
+}
 
 async def main():
     """Main entry point"""
@@ -0,0 +1,195 @@
+import pyodbc
+import pytest
+
+from azure_sql_mcp import connector as connector_module
+from azure_sql_mcp.connector import AzureSQLConnector
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.executed = []
+        self.fast_executemany = False
+
+    def execute(self, *args):
+        if self.conn.dead:
+            raise pyodbc.Error("08S01", "Communication link failure")
+        self.executed.append(args)
+        self.conn.executed.append(args)
+        return self
+
+    def executemany(self, *args):
+        self.conn.executed.append(("executemany",) + args + (self.fast_executemany,))
+
+    def fetchall(self):
+        return [(1,)]
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.dead = False
+        self.commits = 0
+        self.executed = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def execute(self, *args):
+        return self.cursor().execute(*args)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        if self.dead:
+            raise pyodbc.Error("08S01", "Communication link failure")
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def db(monkeypatch):
+    for name in ("SERVER", "DATABASE", "USERNAME", "PASSWORD"):
+        monkeypatch.setenv(f"AZURE_SQL_{name}", "x")
+    db = AzureSQLConnector()
+    db.opened = []
+
+    def connect():
+        conn = FakeConnection()
+        db.opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(db, "get_connection", connect)
+    return db
+
+
+def test_acquire_reuses_released_connection(db):
+    with db.acquire() as first:
+        pass
+    with db.acquire() as second:
+        pass
+
+    assert second is first
+    assert len(db.opened) == 1
+    assert first.commits == 2
+
+
+def test_acquire_rolls_back_and_keeps_connection_on_error(db):
+    with pytest.raises(RuntimeError):
+        with db.acquire():
+            raise RuntimeError("boom")
+
+    with db.acquire() as conn:
+        pass
+    assert len(db.opened) == 1
+    assert not conn.closed
+
+
+def test_acquire_without_reuse_closes_connection(db):
+    with db.acquire(reuse=False) as first:
+        first.execute("USE otherdb")
+
+    with db.acquire() as second:
+        pass
+
+    assert first.closed
+    assert second is not first
+    assert len(db.opened) == 2
+    assert first.commits == 1
+
+
+def test_idle_connection_is_pinged_and_replaced_when_dead(db, monkeypatch):
+    monkeypatch.setattr(connector_module, "POOL_PING_AFTER", 0)
+    with db.acquire() as stale:
+        pass
+    stale.dead = True
+
+    with db.acquire() as conn:
+        pass
+
+    assert conn is not stale
+    assert stale.closed
+    assert len(db.opened) == 2
+
+
+def test_idle_connection_that_answers_ping_is_reused(db, monkeypatch):
+    monkeypatch.setattr(connector_module, "POOL_PING_AFTER", 0)
+    with db.acquire() as first:
+        pass
+
+    with db.acquire() as second:
+        pass
+
+    assert second is first
+    assert ("SELECT 1",) in first.executed
+
+
+def test_recently_used_connection_is_not_pinged(db):
+    with db.acquire() as first:
+        pass
+    with db.acquire():
+        pass
+
+    assert first.executed == []
+
+
+def test_execute_cached_passes_parameters_through_unchanged(db):
+    with db.acquire() as conn:
+        db.execute_cached(conn, "SELECT ? AS v", "ab")
+        db.execute_cached(conn, "SELECT ?, ?", ["a", "b"])
+
+    assert conn.executed == [("SELECT ? AS v", "ab"), ("SELECT ?, ?", ["a", "b"])]
+
+
+def test_execute_cached_reuses_cursor_per_sql_text(db):
+    with db.acquire() as conn:
+        first = db.execute_cached(conn, "SELECT 1")
+        other = db.execute_cached(conn, "SELECT 2")
+        again = db.execute_cached(conn, "SELECT 1")
+
+    assert again is first
+    assert other is not first
+
+
+def test_executemany_cached_uses_fast_executemany(db):
+    sql = "INSERT INTO [t] ([a]) VALUES (?)"
+    with db.acquire() as conn:
+        cursor = db.executemany_cached(conn, sql, [["1"], ["2"]])
+
+    assert conn.executed == [("executemany", sql, [["1"], ["2"]], True)]
+    assert db.execute_cached(conn, sql, ["3"]) is cursor
+
+
+def test_acquire_caps_open_connections(db, monkeypatch):
+    monkeypatch.setattr(connector_module, "POOL_SIZE", 1)
+    monkeypatch.setattr(connector_module, "POOL_TIMEOUT", 0.05)
+    capped = AzureSQLConnector()
+    monkeypatch.setattr(capped, "get_connection", FakeConnection)
+
+    with capped.acquire():
+        with pytest.raises(TimeoutError):
+            with capped.acquire():
+                pass
+
+    with capped.acquire():
+        pass
+
+
+def test_failed_connect_frees_its_slot(db, monkeypatch):
+    monkeypatch.setattr(connector_module, "POOL_SIZE", 1)
+    monkeypatch.setattr(connector_module, "POOL_TIMEOUT", 0.05)
+    capped = AzureSQLConnector()
+
+    def connect():
+        raise pyodbc.Error("08001", "Cannot connect")
+
+    monkeypatch.setattr(capped, "get_connection", connect)
+    for _ in range(2):
+        with pytest.raises(pyodbc.Error):
+            with capped.acquire():
+                pass
@@ -1,2 +1,480 @@
+import asyncio
+import datetime
+import decimal
+import json
+from contextlib import contextmanager
+
+import pytest
+
+from azure_sql_mcp import server
+
+
+class FakeCursor:
+    def __init__(self, result_sets):
+        # Each result set is None (no rows) or (columns, rows)
+        self.result_sets = list(result_sets)
+        self.executed = []
+        self.closed = False
+        self.arraysize = 1
+
+    def execute(self, *args):
+        self.executed.append(args)
+        return self
+
+    @property
+    def description(self):
+        current = self.result_sets[0]
+        return None if current is None else [(column,) for column in current[0]]
+
+    def fetchmany(self, size):
+        columns, rows = self.result_sets[0]
+        batch, self.result_sets[0] = rows[:size], (columns, rows[size:])
+        return batch
+
+    def nextset(self):
+        self.result_sets.pop(0)
+        return bool(self.result_sets)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnector:
+    def __init__(self, cursor):
+        self.conn = type("Conn", (), {"cursor": lambda _self: cursor})()
+        self.reused = []
+
+    @contextmanager
+    def acquire(self, reuse=True):
+        self.reused.append(reuse)
+        yield self.conn
+
+
 def test_dummy():
     assert True
+
+
+def test_stale_build_package_not_importable():
+    import importlib.util
+
+    import azure_sql_mcp
+
+    assert azure_sql_mcp.__name__ == "azure_sql_mcp"
+    assert importlib.util.find_spec("your_mcp_server") is None
+
+
+def test_response_cache_evicts_least_recently_used():
+    cache = server._ResponseCache(ttl=60, maxsize=2)
+    cache.put(("a",), cache.generation, "A")
+    cache.put(("b",), cache.generation, "B")
+    assert cache.get(("a",)) == "A"
+
+    cache.put(("c",), cache.generation, "C")
+
+    assert len(cache) == 2
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) == "A"
+    assert cache.get(("c",)) == "C"
+
+
+def test_response_cache_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(server.time, "monotonic", lambda: now[0])
+    cache = server._ResponseCache(ttl=5, maxsize=10)
+    cache.put(("a",), cache.generation, "A")
+
+    now[0] += 4.9
+    assert cache.get(("a",)) == "A"
+    now[0] += 0.1
+    assert cache.get(("a",)) is None
+    assert len(cache) == 0
+
+
+def test_response_cache_drops_results_from_an_older_generation():
+    cache = server._ResponseCache(ttl=60, maxsize=10)
+    cache.put(("a",), cache.generation, "A")
+    generation = cache.generation
+
+    cache.invalidate()
+    cache.put(("b",), generation, "B")
+
+    assert cache.get(("a",)) is None
+    assert cache.get(("b",)) is None
+
+
+def test_schema_result_racing_ddl_is_not_cached(monkeypatch):
+    monkeypatch.setattr(server, "_schema_cache", server._ResponseCache(ttl=60, maxsize=10))
+
+    async def run_db(func, *args, **kwargs):
+        # DDL lands while the introspection query is in flight
+        server._invalidate_schema_cache()
+        return "Tables in database:\n[]"
+
+    monkeypatch.setattr(server, "_run_db", run_db)
+    result = asyncio.run(server.get_tables({}))
+
+    assert result[0].text == "Tables in database:\n[]"
+    assert server._schema_cache.get(("tables",)) is None
+
+
+def test_schema_result_is_cached(monkeypatch):
+    monkeypatch.setattr(server, "_schema_cache", server._ResponseCache(ttl=60, maxsize=10))
+    calls = []
+
+    async def run_db(func, *args, **kwargs):
+        calls.append(args)
+        return "Schema for table 'Users':\n[]"
+
+    monkeypatch.setattr(server, "_run_db", run_db)
+    asyncio.run(server.get_table_schema({"table_name": "Users"}))
+    result = asyncio.run(server.get_table_schema({"table_name": "Users"}))
+
+    assert result[0].text == "Schema for table 'Users':\n[]"
+    assert calls == [("Users",)]
+
+
+def test_execute_query_drains_pending_result_sets(monkeypatch):
+    cursor = FakeCursor([None, (["id"], [(1,)])])
+    monkeypatch.setattr(server, "connector", FakeConnector(cursor))
+
+    text, returned_rows = server._execute_query_sync("UPDATE t SET x = 1; SELECT id FROM t", [])
+
+    assert (text, returned_rows) == ("Query executed successfully.", False)
+    assert cursor.result_sets == []
+    assert cursor.closed
+
+
+def test_execute_query_returns_rows_and_passes_parameters_unchanged(monkeypatch):
+    cursor = FakeCursor([(["id", "name"], [(1, "a"), (2, "b")])])
+    monkeypatch.setattr(server, "connector", FakeConnector(cursor))
+
+    text, returned_rows = server._execute_query_sync("SELECT id, name FROM t WHERE x = ?", "ab")
+
+    assert returned_rows
+    assert text == "Query executed successfully.\nResults:\n" + json.dumps(
+        [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}], indent=2
+    )
+    assert cursor.executed == [("SELECT id, name FROM t WHERE x = ?", "ab")]
+    assert cursor.closed
+
+
+@pytest.mark.parametrize(
+    ("query", "reuse"),
+    [
+        ("SELECT id FROM t", True),
+        ("USE otherdb", False),
+        ("SET ROWCOUNT 1", False),
+        ("SELECT 1 USE otherdb", False),
+        ("CREATE TABLE #tmp(a int)", False),
+    ],
+)
+def test_execute_query_discards_connection_unless_read_only(monkeypatch, query, reuse):
+    db = FakeConnector(FakeCursor([None]))
+    monkeypatch.setattr(server, "connector", db)
+
+    server._execute_query_sync(query, [])
+
+    assert db.reused == [reuse]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_fetch_json_matches_json_dumps_across_batches(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(server, "orjson", None)
+    elif server.orjson is None:
+        pytest.skip("orjson not installed")
+    columns = ["id", "name", "amount", "created"]
+    created = datetime.datetime(2024, 1, 2, 3, 4, 5)
+    rows = [(i, f"row {i}", decimal.Decimal("1.50"), created) for i in range(7)]
+    cursor = FakeCursor([(columns, rows)])
+    cursor.arraysize = 3
+
+    text = server._fetch_json(cursor)
+
+    assert text == json.dumps([dict(zip(columns, row)) for row in rows], indent=2, default=str)
+
+
+def test_fetch_json_empty_result(monkeypatch):
+    monkeypatch.setattr(server, "orjson", None)
+    cursor = FakeCursor([(["id"], [])])
+
+    assert server._fetch_json(cursor, prefix="P:") == "P:[]"
+
+
+@pytest.mark.parametrize(
+    ("name", "quoted"),
+    [
+        ("Users", "[Users]"),
+        ("dbo.Users", "[dbo].[Users]"),
+        ("[dbo].[Users]", "[dbo].[Users]"),
+        ("dbo.[Order Details]", "[dbo].[Order Details]"),
+        ("[my.table]", "[my.table]"),
+        ("[dbo].[a]]b]", "[dbo].[a]]b]"),
+        ("we]ird", "[we]]ird]"),
+    ],
+)
+def test_quote_table(name, quoted):
+    assert server._quote_table(name) == quoted
+
+
+@pytest.mark.parametrize(
+    "name", ["", "dbo.", ".Users", "dbo..Users", "[dbo]x", "[a]; DROP TABLE t"]
+)
+def test_quote_table_rejects_malformed_names(name):
+    with pytest.raises(ValueError):
+        server._quote_table(name)
+
+
+def test_quote_ident():
+    assert server._quote_ident("Name") == "[Name]"
+    assert server._quote_ident("[Name]") == "[Name]"
+    assert server._quote_ident("a]b") == "[a]]b]"
+    assert server._quote_ident("[a]b]") == "[[a]]b]]]"
+
+
+def test_insert_sql_quotes_and_reuses_template(monkeypatch):
+    monkeypatch.setattr(server, "_insert_template_cache", {})
+
+    sql = server._insert_sql("dbo.Users", ["id", "[Full Name]"])
+
+    assert sql == "INSERT INTO [dbo].[Users] ([id], [Full Name]) VALUES (?, ?)"
+    assert server._insert_sql("dbo.Users", ("id", "[Full Name]")) is sql
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT * FROM Users",
+        "  -- recent\nselect id FROM Users WHERE id = ?;",
+        "/* c */ SELECT name FROM Users ORDER BY name;  ",
+    ],
+)
+def test_is_read_only_accepts_single_selects(query):
+    assert server._is_read_only(query)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "UPDATE Users SET name = 'x'",
+        "SELECT 1; DELETE FROM Users",
+        "SELECT * FROM a\nDELETE FROM b",
+        "SELECT NEXT VALUE FOR dbo.seq",
+        "SELECT * INTO Copy FROM Users",
+        "WITH x AS (SELECT 1 AS a) SELECT a FROM x",
+    ],
+)
+def test_is_read_only_rejects_possible_writes(query):
+    assert not server._is_read_only(query)
+
+
+@pytest.fixture
+def query_db(monkeypatch):
+    monkeypatch.setattr(
+        server,
+        "_query_cache",
+        server._ResponseCache(ttl=60, maxsize=10, max_bytes=server.MAX_CACHE_BYTES),
+    )
+    calls = []
+    responses = {}
+
+    async def run_db(func, query, parameters, *args, **kwargs):
+        calls.append(query)
+        return responses.get(query, ("Query executed successfully.", False))
+
+    monkeypatch.setattr(server, "_run_db", run_db)
+    return calls, responses
+
+
+def run_query(query, parameters=()):
+    arguments = {"query": query, "parameters": list(parameters)}
+    return asyncio.run(server.execute_query(arguments))[0].text
+
+
+def test_repeated_select_is_served_from_cache(query_db):
+    calls, responses = query_db
+    responses["SELECT 1"] = ("rows", True)
+
+    assert run_query("SELECT 1") == "rows"
+    assert run_query("SELECT 1") == "rows"
+    assert calls == ["SELECT 1"]
+
+
+def test_cache_key_includes_parameters(query_db):
+    calls, responses = query_db
+    responses["SELECT ?"] = ("rows", True)
+
+    run_query("SELECT ?", ["1"])
+    run_query("SELECT ?", ["2"])
+
+    assert calls == ["SELECT ?", "SELECT ?"]
+
+
+def test_write_invalidates_cached_selects(query_db):
+    calls, responses = query_db
+    responses["SELECT 1"] = ("rows", True)
+
+    run_query("SELECT 1")
+    run_query("UPDATE t SET x = 1")
+    run_query("SELECT 1")
+
+    assert calls == ["SELECT 1", "UPDATE t SET x = 1", "SELECT 1"]
+
+
+def test_batch_starting_with_select_is_not_cached_and_invalidates(query_db):
+    calls, responses = query_db
+    responses["SELECT 1"] = ("rows", True)
+    batch = "SELECT 1; DELETE FROM t"
+    responses[batch] = ("rows", True)
+
+    run_query("SELECT 1")
+    run_query(batch)
+    run_query(batch)
+    run_query("SELECT 1")
+
+    assert calls == ["SELECT 1", batch, batch, "SELECT 1"]
+
+
+def test_oversized_result_is_not_cached(query_db, monkeypatch):
+    calls, responses = query_db
+    responses["SELECT big"] = ("x" * 200, True)
+    monkeypatch.setattr(server._query_cache, "max_bytes", 100)
+
+    run_query("SELECT big")
+    run_query("SELECT big")
+
+    assert calls == ["SELECT big", "SELECT big"]
+
+
+def test_select_racing_a_write_is_not_cached(query_db, monkeypatch):
+    calls, _ = query_db
+
+    async def run_db(func, query, parameters, *args, **kwargs):
+        calls.append(query)
+        # A write completes while this SELECT is still running
+        server._invalidate_query_cache()
+        return "rows", True
+
+    monkeypatch.setattr(server, "_run_db", run_db)
+    run_query("SELECT 1")
+
+    assert len(server._query_cache) == 0
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT * INTO t2 FROM t",
+        "INSERT INTO t VALUES(1); DROP TABLE t",
+        "IF OBJECT_ID('x') IS NULL CREATE TABLE x(a int)",
+        "EXEC sp_rename 't', 'u'",
+    ],
+)
+def test_non_read_only_query_invalidates_schema_cache(query_db, monkeypatch, query):
+    monkeypatch.setattr(server, "_schema_cache", server._ResponseCache(ttl=60, maxsize=10))
+    server._schema_cache.put(("tables",), server._schema_cache.generation, "old")
+
+    run_query(query)
+
+    assert server._schema_cache.get(("tables",)) is None
+
+
+def test_failed_batch_invalidates_schema_cache(query_db, monkeypatch):
+    monkeypatch.setattr(server, "_schema_cache", server._ResponseCache(ttl=60, maxsize=10))
+    server._schema_cache.put(("tables",), server._schema_cache.generation, "old")
+
+    async def run_db(func, query, parameters, *args, **kwargs):
+        raise RuntimeError("second statement failed")
+
+    monkeypatch.setattr(server, "_run_db", run_db)
+    run_query("CREATE TABLE a(x int); INSERT INTO missing VALUES(1)")
+
+    assert server._schema_cache.get(("tables",)) is None
+
+
+def test_read_only_select_keeps_schema_cache(query_db, monkeypatch):
+    calls, responses = query_db
+    responses["SELECT 1"] = ("rows", True)
+    monkeypatch.setattr(server, "_schema_cache", server._ResponseCache(ttl=60, maxsize=10))
+    server._schema_cache.put(("tables",), server._schema_cache.generation, "old")
+
+    run_query("SELECT 1")
+
+    assert server._schema_cache.get(("tables",)) == "old"
+
+
+class RecordingConnector:
+    def __init__(self):
+        self.calls = []
+
+    @contextmanager
+    def acquire(self, reuse=True):
+        yield object()
+
+    def execute_cached(self, conn, sql, params=()):
+        self.calls.append(("execute", sql, params))
+
+    def executemany_cached(self, conn, sql, rows):
+        self.calls.append(("executemany", sql, rows))
+
+
+@pytest.fixture
+def insert_db(monkeypatch):
+    db = RecordingConnector()
+    monkeypatch.setattr(server, "connector", db)
+    monkeypatch.setattr(server, "_insert_template_cache", {})
+
+    async def run_db(func, *args, **kwargs):
+        return func(*args)
+
+    monkeypatch.setattr(server, "_run_db", run_db)
+    return db
+
+
+def call_tool(name, arguments):
+    return asyncio.run(server.handle_call_tool(name, arguments))[0].text
+
+
+def test_insert_data_single_row(insert_db):
+    text = call_tool(
+        "insert_data", {"table_name": "dbo.Users", "columns": ["id", "name"], "values": ["1", "a"]}
+    )
+
+    assert text == "Data inserted into 'dbo.Users' successfully."
+    assert insert_db.calls == [
+        ("execute", "INSERT INTO [dbo].[Users] ([id], [name]) VALUES (?, ?)", ["1", "a"])
+    ]
+
+
+def test_insert_data_batch_rows(insert_db):
+    rows = [["1", "a"], ["2", "b"]]
+    text = call_tool("insert_data", {"table_name": "Users", "columns": ["id", "name"], "rows": rows})
+
+    assert text == "2 rows inserted into 'Users' successfully."
+    assert insert_db.calls == [
+        ("executemany", "INSERT INTO [Users] ([id], [name]) VALUES (?, ?)", rows)
+    ]
+
+
+def test_insert_data_requires_values_or_rows(insert_db):
+    text = call_tool("insert_data", {"table_name": "Users", "columns": ["id"]})
+
+    assert text.startswith("Failed to insert data")
+    assert insert_db.calls == []
+
+
+def test_insert_data_invalidates_query_cache(insert_db, monkeypatch):
+    monkeypatch.setattr(server, "_query_cache", server._ResponseCache(ttl=60, maxsize=10))
+    server._query_cache.put(("SELECT 1", "[]"), server._query_cache.generation, "rows")
+
+    call_tool("insert_data", {"table_name": "Users", "columns": ["id"], "values": ["1"]})
+
+    assert len(server._query_cache) == 0
+
+
+def test_insert_data_tool_schema_accepts_rows():
+    tools = {tool.name: tool for tool in asyncio.run(server.handle_list_tools())}
+    schema = tools["insert_data"].inputSchema
+
+    assert "rows" in schema["properties"]
+    assert schema["required"] == ["table_name", "columns"]